@@ -0,0 +1,380 @@
+"""
+Character design generation - intent mapping and specification building
+
+This module holds the deterministic generation path behind the MCP tools:
+mapping design intent to taxonomy choices through the olog morphisms and
+assembling the character specification. It is fully typed so it can be
+compiled with mypyc; the tool wrappers stay in server.py, where FastMCP
+reads their signatures and docstrings.
+"""
+
+import hashlib
+import functools
+from typing import Any, Dict, List, Mapping, Optional
+from sanrio_characters.tools.olog_loader import OlogLoader
+
+# ============================================================================
+# OLOG LOADING
+# ============================================================================
+
+@functools.lru_cache(maxsize=1)
+def _get_loader() -> OlogLoader:
+    """Get the shared OlogLoader, loading the ologs on first call."""
+    return OlogLoader()
+
+
+# ============================================================================
+# DESIGN INTENT MAPPING (maps Claude's analysis to taxonomy)
+# ============================================================================
+
+# Free-text design_intent fields consulted by the intent morphisms
+_INTENT_FIELDS = (
+    "weight_feeling",
+    "primary_shape",
+    "size_implication",
+    "color_feeling",
+    "inferred_emotional_tone",
+)
+
+# Direct intent lookups for color palette and facial style
+_COLOR_MAPPING = {
+    "muted": "dusty_rose_sage_cream",
+    "dusty": "dusty_rose_sage_cream",
+    "desaturated": "dusty_rose_sage_cream",
+    "warm": "butter_yellow_peach_blue",
+    "cozy": "butter_yellow_peach_blue",
+    "cool": "lavender_mint_sky_blue",
+    "ethereal": "pale_lavender_pearl_white",
+    "vivid": "coral_mint_cream",
+    "pastel": "soft_pink_lavender_mint",
+}
+
+_FACIAL_MAPPING = {
+    "joyful_character_archetype": "dot_eyes_curved_smile",
+    "melancholic_character_archetype": "closed_happy_eyes",
+    "anxious_character_archetype": "worried_upturned_eyes",
+    "sleepy_character_archetype": "closed_curved_eyes",
+    "mischievous_character_archetype": "sparkle_mischievous_grin",
+    "dreamy_character_archetype": "wide_dreamy_eyes",
+    "determined_character_archetype": "focused_straight_gaze",
+}
+
+
+def _lowercase_intent(design_intent: Dict[str, Any]) -> Dict[str, str]:
+    """Lowercase each free-text intent field once, for all morphisms and the rationale."""
+    return {k: (design_intent.get(k) or "").lower() for k in _INTENT_FIELDS}
+
+
+def _map_intent_to_design_choices(di: Dict[str, str]) -> Dict[str, str]:
+    """
+    Map Claude's design intent to specific taxonomy choices using olog morphisms.
+    
+    Implements morphisms:
+    - design_intent_to_head_shape
+    - design_intent_to_body_proportion
+    - design_intent_to_color_triad
+    - design_intent_to_size_category
+    - emotional_tone_to_facial_style
+    
+    Args:
+        di: Lowercased intent fields from _lowercase_intent
+    """
+    
+    loader = _get_loader()
+    taxonomy = loader.get_taxonomy()
+    
+    head_shapes = taxonomy['HeadShape']['instances']
+    body_proportions = taxonomy['BodyProportion']['instances']
+    color_triads = taxonomy['ColorTriad']['instances']
+    size_categories = taxonomy['SizeCategory']['instances']
+    facial_styles = taxonomy['FacialStyle']['instances']
+    
+    # Initialize with defaults
+    selected: Dict[str, str] = {
+        "head_shape": head_shapes[0],
+        "body_proportion": body_proportions[0],
+        "facial_style": facial_styles[0],
+        "color_triad": loader.aesthetic_olog['olog']['types']['ColorTriad']['instances'][0],
+        "size_category": size_categories[0]
+    }
+    
+    weight_feeling = di["weight_feeling"]
+    primary_shape = di["primary_shape"]
+    size_implication = di["size_implication"]
+    
+    # Map weight_feeling and primary_shape to head shape
+    if "droop" in weight_feeling or "droop" in primary_shape:
+        selected["head_shape"] = "elongated_teardrop"
+    elif "curved" in primary_shape or "flowing" in primary_shape:
+        selected["head_shape"] = "cat_like_curved"
+    elif "blob" in primary_shape or "amorphous" in primary_shape:
+        selected["head_shape"] = "minimalist_blob"
+    elif "geometric" in primary_shape or "sharp" in primary_shape:
+        selected["head_shape"] = "simplified_geometric"
+    elif "wide" in primary_shape or "flat" in primary_shape:
+        selected["head_shape"] = "wide_and_flat"
+    elif "pointed" in primary_shape or "spike" in primary_shape:
+        selected["head_shape"] = "ovoid_with_point"
+    elif "round" in weight_feeling or "soft" in weight_feeling:
+        selected["head_shape"] = "large_round_orb"
+    
+    # Map weight_feeling and size_implication to body proportion
+    if "tiny" in size_implication or "insignificant" in size_implication or "miniature" in weight_feeling:
+        selected["body_proportion"] = "tiny_torso_large_head"
+    elif "weighted" in weight_feeling or "heavy" in weight_feeling or "grounded" in weight_feeling:
+        selected["body_proportion"] = "body_focused_30_70"
+    elif "fluid" in weight_feeling or "flowing" in weight_feeling or "extended" in weight_feeling:
+        selected["body_proportion"] = "extended_and_fluid"
+    elif "limbless" in weight_feeling or "blob" in weight_feeling:
+        selected["body_proportion"] = "limbless_blob"
+    elif "head-heavy" in size_implication or "top-heavy" in weight_feeling:
+        selected["body_proportion"] = "head_dominant_80_20"
+    else:
+        selected["body_proportion"] = "balanced_cute_50_50"
+    
+    # Map color_feeling to color triad (using archetype rules)
+    selected["color_triad"] = _COLOR_MAPPING.get(di["color_feeling"], "soft_pink_lavender_mint")
+    
+    # Map emotional tone to facial style
+    selected["facial_style"] = _FACIAL_MAPPING.get(di["inferred_emotional_tone"], "dot_eyes_curved_smile")
+    
+    # Map size_implication to size category
+    if "tiny" in size_implication or "pocket" in size_implication or "miniature" in size_implication:
+        selected["size_category"] = "small_plush_toy"
+    elif "small" in size_implication or "delicate" in size_implication:
+        selected["size_category"] = "small_decorative"
+    elif "medium" in size_implication or "standard" in size_implication:
+        selected["size_category"] = "medium_standard"
+    elif "large" in size_implication or "prominent" in size_implication:
+        selected["size_category"] = "large_display"
+    else:
+        selected["size_category"] = "medium_standard"
+    
+    return selected
+
+
+def _get_design_rationale(design_choices: Dict[str, str], di: Dict[str, str]) -> str:
+    """Generate explanation for design choices based on (lowercased) intent."""
+    rationale_parts: List[str] = []
+    
+    head_shape = design_choices.get("head_shape", "")
+    if "droop" in di["weight_feeling"]:
+        rationale_parts.append(f"The {head_shape} head shape conveys drooping and introspection")
+    
+    body_prop = design_choices.get("body_proportion", "")
+    if "weighted" in di["weight_feeling"]:
+        rationale_parts.append(f"The {body_prop} proportion grounds the character's weight")
+    
+    color = design_choices.get("color_triad", "")
+    if "muted" in di["color_feeling"]:
+        rationale_parts.append(f"The {color} palette reflects muted emotional tone")
+    
+    size = design_choices.get("size_category", "")
+    if "small" in di["size_implication"]:
+        rationale_parts.append(f"The {size} reflects vulnerability and intimacy")
+    
+    if not rationale_parts:
+        rationale_parts.append(f"Design choices selected to match emotional intent")
+    
+    return "; ".join(rationale_parts)
+
+
+# ============================================================================
+# CHARACTER SPECIFICATION
+# ============================================================================
+
+# Static specification content for every generated character (the tuples are
+# shared; _OLOG_SOURCE is copied per specification since it is a dict)
+_UNIVERSAL_PRINCIPLES = (
+    "Proportion precision: maintain ratio relationships",
+    "Feature economy: each feature must earn its existence",
+    "Pastel restraint: stay within soft color spectrum",
+    "Approachability priority: no sharp edges or judgment",
+    "Emotional honesty: character must be authentic to its emotion",
+)
+
+_MORPHISMS_APPLIED = (
+    "design_intent_to_head_shape",
+    "design_intent_to_body_proportion",
+    "design_intent_to_color_triad",
+    "design_intent_to_facial_style",
+)
+
+_COMMUTATIVE_DIAGRAMS = (
+    "proportional_coherence",
+    "emotional_coherence",
+    "expressiveness_balance",
+)
+
+# Character name prefix per archetype
+_NAME_PREFIXES = {
+    "joyful_character_archetype": "Joy",
+    "melancholic_character_archetype": "Melan",
+    "anxious_character_archetype": "Anx",
+    "sleepy_character_archetype": "Sleep",
+    "mischievous_character_archetype": "Misc",
+    "dreamy_character_archetype": "Dream",
+    "determined_character_archetype": "Det",
+}
+
+_OLOG_SOURCE = {
+    "aesthetic_olog": "sanrio.olog.yaml",
+    "intentionality_olog": "sanrio_intentionality.olog.yaml",
+    "morphisms_applied": _MORPHISMS_APPLIED,
+    "commutative_diagrams_checked": _COMMUTATIVE_DIAGRAMS,
+}
+
+
+def _build_character_specification(
+    user_prompt: str, design_intent: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Build a character design specification (uncached)."""
+    
+    prompt_lower = user_prompt.lower()
+    
+    # Step 1: Infer emotional tone and concept type from user prompt
+    # by checking against archetype keywords
+    loader = _get_loader()
+    archetypes = loader.get_intentionality_instances()
+    
+    matched_tone = loader.match_archetype(prompt_lower)
+    
+    if matched_tone:
+        inferred_tone = matched_tone
+        inferred_archetype: Mapping[str, Any] = archetypes[inferred_tone]
+    else:
+        inferred_tone = "joyful_character_archetype"  # Default
+        inferred_archetype = archetypes.get("joyful_character_archetype", {})
+    
+    # Step 2: Deterministic seeding (same prompt = same design)
+    # (blake2s rather than hash(), which is randomized per process)
+    seed = int.from_bytes(
+        hashlib.blake2s(user_prompt.encode("utf-8"), digest_size=4).digest(), "little"
+    ) % 100
+    
+    # Step 3: Map design intent to taxonomy choices using morphisms
+    if design_intent:
+        design_intent['inferred_emotional_tone'] = inferred_tone
+        di = _lowercase_intent(design_intent)
+        design_choices = _map_intent_to_design_choices(di)
+        design_rationale = _get_design_rationale(design_choices, di)
+    else:
+        # Fallback: use archetype's composition_principle to select defaults
+        archetype_comp = inferred_archetype.get('composition_principle', '')
+        design_choices = {
+            "head_shape": "large_round_orb",
+            "body_proportion": "balanced_cute_50_50",
+            "facial_style": "dot_eyes_curved_smile",
+            "color_triad": "soft_pink_lavender_mint",
+            "size_category": "small_plush_toy"
+        }
+        design_rationale = f"Archetype-based selection: {inferred_tone}"
+    
+    # Step 4: Generate character name
+    first_word = prompt_lower.split()[0][:3]
+    prefix = _NAME_PREFIXES.get(inferred_tone, "Sanrio")
+    name = f"{prefix}{first_word.capitalize()}"
+    
+    # Human-readable choice names; intent mappings may select names not
+    # listed in the aesthetic olog
+    human = loader.human
+    head_shape = design_choices["head_shape"]
+    body_proportion = design_choices["body_proportion"]
+    facial_style = design_choices["facial_style"]
+    size_category = design_choices["size_category"]
+    color_triad = design_choices["color_triad"]
+    
+    # Step 5: Return complete design specification
+    design_specification = {
+        "character_name": name,
+        "emotional_tone": inferred_tone,
+        "design_seed": seed,
+        "user_prompt": user_prompt,
+        
+        # Design elements from taxonomy
+        "head_shape": head_shape,
+        "body_proportion": body_proportion,
+        "facial_style": facial_style,
+        "size_category": size_category,
+        "color_triad": color_triad,
+        
+        # Archetype information
+        "archetype": inferred_tone,
+        "core_intention": inferred_archetype.get('core_intention', ''),
+        "composition_principle": inferred_archetype.get('composition_principle', ''),
+        
+        # Design rationale (from morphisms and commutative diagrams)
+        "design_rationale": design_rationale,
+        "why_this_works": inferred_archetype.get('why_this_works', ''),
+        
+        # Design guidelines for image generation
+        "design_guidelines": {
+            "aesthetic": "Sanrio style: cute, simplified shapes, minimal features, pastel-friendly",
+            "head_description": f"Use a {human.get(head_shape) or head_shape.replace('_', ' ')} shape for the head",
+            "body_description": f"Body should be {human.get(body_proportion) or body_proportion.replace('_', ' ')}",
+            "facial_description": f"Face features: {human.get(facial_style) or facial_style.replace('_', ' ')}",
+            "size_note": f"Character size: {human.get(size_category) or size_category.replace('_', ' ')}",
+            "color_note": f"Use {human.get(color_triad) or color_triad.replace('_', ' ')} color palette",
+            "universal_principles": _UNIVERSAL_PRINCIPLES
+        },
+        
+        # Olog metadata
+        "olog_source": dict(_OLOG_SOURCE)
+    }
+    
+    return design_specification
+
+
+@functools.lru_cache(maxsize=1024)
+def _generate_sanrio_character_cached(user_prompt: str, intent_items: tuple) -> Dict[str, Any]:
+    """Memoized character generation keyed on normalized design intent items."""
+    return _build_character_specification(user_prompt, dict(intent_items))
+
+
+def _generate_sanrio_character_impl(
+    user_prompt: str, design_intent: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Internal implementation of character generation.
+    
+    Generate a complete Sanrio character design based on user prompt and optional design intent.
+    
+    Uses YAML olog specifications to ensure:
+    1. Categorical structure (sanrio.olog.yaml) defines valid design choices
+    2. Design morphisms map intent to taxonomy selections
+    3. Commutative diagrams validate coherence
+    
+    Args:
+        user_prompt: User's creative concept (e.g., "the feeling of procrastination")
+        design_intent: Optional dict from Claude with design analysis:
+            - mood: Creative mood description
+            - weight_feeling: How design should feel
+            - color_feeling: Color palette guidance
+            - size_implication: Size guidance
+            - primary_shape: Dominant shape characteristic
+            - inferred_emotional_tone: What emotion is this character?
+            - design_rationale: Why this design matches the concept
+        
+    Returns:
+        Complete character design specification with all parameters.
+        Results are memoized per (user_prompt, design_intent); the returned
+        dict and its design_guidelines and olog_source dicts are fresh copies.
+    """
+    
+    try:
+        intent_items = tuple(sorted((design_intent or {}).items()))
+        hash(intent_items)
+    except TypeError:
+        # Unhashable intent values (nested lists/dicts) bypass the cache
+        return _build_character_specification(user_prompt, design_intent)
+    
+    # Copy the cached entry and its nested dicts so callers cannot modify it;
+    # the remaining nested values are strings and tuples
+    result = dict(_generate_sanrio_character_cached(user_prompt, intent_items))
+    result['design_guidelines'] = dict(result['design_guidelines'])
+    result['olog_source'] = dict(result['olog_source'])
+    
+    if design_intent:
+        design_intent['inferred_emotional_tone'] = result['emotional_tone']
+    
+    return result
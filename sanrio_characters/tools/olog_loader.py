@@ -6,17 +6,51 @@ validating their structure, and providing access to taxonomy and intentionality
 """
 
 from pathlib import Path
+import json
+import os
+import sys
+import tempfile
 import yaml
 import logging
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively convert dicts to MappingProxyType and lists to tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+
+def _thaw(obj: Any) -> Any:
+    """Recursively convert frozen olog data back to plain dicts and lists."""
+    # Concrete types rather than the Mapping ABC, whose isinstance checks
+    # are several times slower
+    if isinstance(obj, (MappingProxyType, dict)):
+        return {key: _thaw(value) for key, value in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(value) for value in obj]
+    return obj
+
 
 class OlogLoader:
-    """Load and cache olog specifications from YAML files."""
+    """
+    Load and cache olog specifications from YAML files.
     
-    def __init__(self, olog_dir: Path = None):
+    Parsed ologs, the taxonomy and the archetype instances are frozen
+    (dicts become MappingProxyType, lists become tuples) and shared by all
+    callers; they never need to be copied defensively.
+    """
+    
+    def __init__(self, olog_dir: Optional[Path] = None):
         """
         Initialize the OlogLoader.
         
@@ -32,26 +66,33 @@ class OlogLoader:
             olog_dir = package_dir / "data" / "ologs"
         
         self.olog_dir = olog_dir
-        self.aesthetic_olog = None
-        self.intentionality_olog = None
-        self.taxonomy_cache = None
-        self.intent_mapping_cache = None
+        self.aesthetic_olog: Mapping[str, Any] = MappingProxyType({})
+        self.intentionality_olog: Mapping[str, Any] = MappingProxyType({})
+        self.human: Dict[str, str] = {}
         
         self._load_ologs()
+        
+        # Both views are needed by every caller, so build them eagerly and
+        # expose them read-only
+        self.taxonomy = MappingProxyType(self._build_taxonomy())
+        self.archetypes = MappingProxyType({
+            sys.intern(name): archetype
+            for name, archetype in self.intentionality_olog['olog'].get('instances', {}).items()
+        })
+        self._build_archetype_index()
+        self._build_archetype_views()
     
     def _load_ologs(self):
         """Load and validate olog YAML files."""
         try:
             # Load aesthetic olog
             aesthetic_path = self.olog_dir / "sanrio.olog.yaml"
-            with open(aesthetic_path, 'r') as f:
-                self.aesthetic_olog = yaml.safe_load(f)
+            self.aesthetic_olog = _freeze(self._load_olog_file(aesthetic_path))
             logger.info(f"✓ Loaded aesthetic olog from {aesthetic_path}")
             
             # Load intentionality olog
             intentionality_path = self.olog_dir / "sanrio_intentionality.olog.yaml"
-            with open(intentionality_path, 'r') as f:
-                self.intentionality_olog = yaml.safe_load(f)
+            self.intentionality_olog = _freeze(self._load_olog_file(intentionality_path))
             logger.info(f"✓ Loaded intentionality olog from {intentionality_path}")
             
         except FileNotFoundError as e:
@@ -61,11 +102,104 @@ class OlogLoader:
             logger.error(f"YAML parsing error: {e}")
             raise
     
-    def get_taxonomy(self) -> Dict:
-        """Get flattened taxonomy from aesthetic olog."""
-        if self.taxonomy_cache is not None:
-            return self.taxonomy_cache
+    def _load_olog_file(self, yaml_path: Path) -> Dict:
+        """
+        Load a single olog, preferring its JSON sidecar cache.
+        
+        The parsed YAML is written to a companion .json file (e.g.
+        sanrio.olog.yaml -> sanrio.olog.json) and reused on later startups
+        for as long as it is at least as new as the YAML source.
+        """
+        json_path = yaml_path.with_suffix(".json")
+        yaml_mtime = yaml_path.stat().st_mtime
+        
+        try:
+            if json_path.stat().st_mtime >= yaml_mtime:
+                with open(json_path, 'r') as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            # Missing, unreadable or corrupt cache: fall back to the YAML source
+            pass
+        
+        # Binary mode lets libyaml decode the stream itself
+        with open(yaml_path, 'rb') as f:
+            data = yaml.load(f, Loader=Loader)
+        
+        # Only cache data that survives a JSON round trip unchanged: JSON
+        # cannot hold some YAML values (e.g. dates) and turns non-string
+        # keys into strings
+        try:
+            dumped = json.dumps(data)
+            cacheable = json.loads(dumped) == data
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching olog {yaml_path}: {e}")
+            return data
+        if not cacheable:
+            logger.debug(f"Not caching olog {yaml_path}: data does not round-trip through JSON")
+            return data
+        
+        # Write to a temporary file and rename it into place, so concurrent
+        # starts never see a half-written sidecar
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=json_path.parent, prefix=json_path.name, suffix=".tmp"
+            )
+            with os.fdopen(fd, 'w') as f:
+                f.write(dumped)
+            # mkstemp creates the file as 0600; give the sidecar the mode a
+            # plain open() would have
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o644 & ~umask)
+            os.replace(tmp_path, json_path)
+        except OSError as e:
+            logger.debug(f"Could not write olog cache {json_path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        return data
+    
+    def _build_archetype_index(self):
+        """Flatten archetype keywords into ordered (name, keywords) pairs for matching."""
+        self._archetype_keywords = tuple(
+            (archetype_name, tuple(archetype.get('design_intent_keywords', ())))
+            for archetype_name, archetype in self.archetypes.items()
+        )
+    
+    def _build_archetype_views(self):
+        """
+        Pre-project each archetype into the shape served by get_archetype_rules.
         
+        Views are thawed to plain dicts and lists once here, so they are
+        JSON-serializable without any per-call copying.
+        """
+        self._archetype_views = {
+            archetype_name: _thaw({
+                "archetype": archetype_name,
+                "core_intention": archetype.get('core_intention', ''),
+                "composition_principle": archetype.get('composition_principle', ''),
+                "why_this_works": archetype.get('why_this_works', ''),
+                "sensory_principles": archetype.get('sensory_principles', []),
+                "proportion_rules": archetype.get('proportion_rules', {}),
+                "design_keywords": archetype.get('design_intent_keywords', []),
+                "forbidden_combinations": archetype.get('forbidden_combinations', []),
+                "examples": archetype.get('examples', [])
+            })
+            for archetype_name, archetype in self.archetypes.items()
+            if archetype
+        }
+    
+    def match_archetype(self, text: str) -> Optional[str]:
+        """Find the first archetype (in olog order) with a keyword contained in text."""
+        for archetype_name, keywords in self._archetype_keywords:
+            for kw in keywords:
+                if kw in text:
+                    return archetype_name
+        return None
+    
+    def _build_taxonomy(self) -> Dict:
+        """Build flattened taxonomy from aesthetic olog."""
         # Extract and flatten the types from the olog
         olog = self.aesthetic_olog['olog']
         types_dict = olog.get('types', {})
@@ -74,33 +208,50 @@ class OlogLoader:
         
         # Extract instances from each type
         for type_name, type_def in types_dict.items():
-            if 'instances' in type_def and isinstance(type_def['instances'], list):
-                taxonomy[type_name] = {
+            if 'instances' in type_def and isinstance(type_def['instances'], tuple):
+                taxonomy[type_name] = MappingProxyType({
                     'description': type_def.get('description', ''),
-                    'instances': type_def['instances'],
+                    # Interned so equality checks and dict lookups on the
+                    # selected names short-circuit on identity
+                    'instances': tuple(
+                        sys.intern(inst) if isinstance(inst, str) else inst
+                        for inst in type_def['instances']
+                    ),
                     'properties': type_def.get('properties', {})
-                }
+                })
+        
+        # Human-readable forms of every instance name, e.g. "large round orb"
+        self.human = {
+            inst: inst.replace('_', ' ')
+            for type_def in taxonomy.values()
+            for inst in type_def['instances']
+            if isinstance(inst, str)
+        }
         
-        self.taxonomy_cache = taxonomy
-        return self.taxonomy_cache
+        return taxonomy
     
-    def get_intentionality_instances(self) -> Dict:
+    def get_taxonomy(self) -> Mapping:
+        """Get flattened taxonomy from aesthetic olog."""
+        return self.taxonomy
+    
+    def get_intentionality_instances(self) -> Mapping:
         """Get character archetype instances from intentionality olog."""
-        if self.intent_mapping_cache is not None:
-            return self.intent_mapping_cache
-        
-        olog = self.intentionality_olog['olog']
-        instances = olog.get('instances', {})
-        
-        self.intent_mapping_cache = instances
-        return self.intent_mapping_cache
+        return self.archetypes
     
-    def get_commutative_diagrams(self) -> Dict:
+    def get_commutative_diagrams(self) -> Mapping:
         """Get coherence constraints from aesthetic olog."""
         olog = self.aesthetic_olog['olog']
         return olog.get('commutative_diagrams', {})
     
-    def get_archetype_rules(self, archetype_name: str) -> Optional[Dict]:
+    def get_archetype_rules(self, archetype_name: str) -> Optional[Mapping]:
         """Get design rules for a specific archetype."""
-        instances = self.get_intentionality_instances()
-        return instances.get(archetype_name)
+        return self.archetypes.get(archetype_name)
+    
+    def get_archetype_view(self, archetype_name: str) -> Optional[Dict]:
+        """
+        Get the pre-projected rules summary for a specific archetype.
+        
+        Returns a plain dict/list structure shared between calls, which must
+        not be modified, or None for an unknown archetype.
+        """
+        return self._archetype_views.get(archetype_name)
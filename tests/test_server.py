@@ -4,8 +4,10 @@ Tests for Sanrio Characters MCP Server
 Run with: pytest tests/
 """
 
+import os
 import pytest
 from pathlib import Path
+from sanrio_characters.tools.olog_loader import OlogLoader
 from sanrio_characters.server import (
     _generate_sanrio_character_impl,
     get_archetype_rules,
@@ -49,6 +51,86 @@ class TestOlogLoading:
             'determined_character_archetype'
         }
         assert set(ARCHETYPES.keys()) == expected_archetypes
+    
+    def test_taxonomy_and_archetypes_are_read_only(self):
+        """Test that loader views cannot be mutated by callers."""
+        with pytest.raises(TypeError):
+            TAXONOMY['NewType'] = {}
+        with pytest.raises(TypeError):
+            ARCHETYPES['new_archetype'] = {}
+    
+    def test_parsed_ologs_are_frozen(self):
+        """Test that nested olog data is exposed as read-only views."""
+        diagrams = OLOG_LOADER.get_commutative_diagrams()
+        with pytest.raises(TypeError):
+            diagrams['new_diagram'] = {}
+        
+        instances = TAXONOMY['HeadShape']['instances']
+        assert isinstance(instances, tuple)
+    
+    def test_json_sidecar_cache(self, tmp_path):
+        """Test that parsed ologs are cached to JSON and reused."""
+        names = ("sanrio.olog.yaml", "sanrio_intentionality.olog.yaml")
+        for name in names:
+            (tmp_path / name).write_text((OLOG_LOADER.olog_dir / name).read_text())
+        
+        first = OlogLoader(tmp_path)
+        assert (tmp_path / "sanrio.olog.json").exists()
+        assert (tmp_path / "sanrio_intentionality.olog.json").exists()
+        
+        # Corrupt the YAML but keep it older than the sidecar: only a load
+        # from the JSON cache can still succeed
+        for name in names:
+            yaml_path = tmp_path / name
+            json_mtime = yaml_path.with_suffix(".json").stat().st_mtime
+            yaml_path.write_text("olog: [unterminated")
+            os.utime(yaml_path, (json_mtime - 10, json_mtime - 10))
+        
+        second = OlogLoader(tmp_path)
+        assert second.aesthetic_olog == first.aesthetic_olog
+        assert second.intentionality_olog == first.intentionality_olog
+    
+    def test_json_sidecar_skipped_for_non_json_values(self, tmp_path):
+        """Test that YAML values JSON cannot represent skip the cache cleanly."""
+        for name in ("sanrio.olog.yaml", "sanrio_intentionality.olog.yaml"):
+            (tmp_path / name).write_text((OLOG_LOADER.olog_dir / name).read_text())
+        with open(tmp_path / "sanrio.olog.yaml", "a") as f:
+            f.write("\nbuilt_on: 2024-01-01\n")
+        
+        loader = OlogLoader(tmp_path)
+        assert loader.aesthetic_olog['built_on'] is not None
+        assert not (tmp_path / "sanrio.olog.json").exists()
+        assert list(tmp_path.glob("*.tmp")) == []
+    
+    def test_json_sidecar_skipped_for_non_string_keys(self, tmp_path):
+        """Test that keys JSON would turn into strings skip the cache."""
+        for name in ("sanrio.olog.yaml", "sanrio_intentionality.olog.yaml"):
+            (tmp_path / name).write_text((OLOG_LOADER.olog_dir / name).read_text())
+        with open(tmp_path / "sanrio.olog.yaml", "a") as f:
+            f.write("\nrevisions:\n  1: initial\n")
+        
+        loader = OlogLoader(tmp_path)
+        assert loader.aesthetic_olog['revisions'][1] == 'initial'
+        assert not (tmp_path / "sanrio.olog.json").exists()
+        assert (tmp_path / "sanrio_intentionality.olog.json").exists()
+    
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_json_sidecar_is_world_readable(self, tmp_path):
+        """Test that sidecars get the default file mode, not mkstemp's 0600."""
+        for name in ("sanrio.olog.yaml", "sanrio_intentionality.olog.yaml"):
+            (tmp_path / name).write_text((OLOG_LOADER.olog_dir / name).read_text())
+        
+        OlogLoader(tmp_path)
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = (tmp_path / "sanrio.olog.json").stat().st_mode & 0o777
+        assert mode == 0o644 & ~umask
+    
+    def test_match_archetype_uses_olog_order(self):
+        """Test that keyword matching prefers the earliest archetype."""
+        assert OLOG_LOADER.match_archetype("a sad but cheerful day") == 'joyful_character_archetype'
+        assert OLOG_LOADER.match_archetype("so sleepy and tired") == 'sleepy_character_archetype'
+        assert OLOG_LOADER.match_archetype("nothing to see") is None
 
 
 class TestCharacterGeneration:
@@ -98,6 +180,33 @@ class TestCharacterGeneration:
         assert result1['body_proportion'] == result2['body_proportion']
         assert result1['design_seed'] == result2['design_seed']
     
+    def test_design_seed_is_stable_across_processes(self):
+        """Test that the design seed does not depend on PYTHONHASHSEED."""
+        result = _generate_sanrio_character_impl("procrastination")
+        
+        # Pinned value: a per-process salted hash could not reproduce it
+        assert result['design_seed'] == 71
+    
+    def test_cached_generation_returns_fresh_dict(self):
+        """Test that memoized results are not shared between callers."""
+        design_intent = {"weight_feeling": "drooping", "primary_shape": "curved"}
+        result1 = _generate_sanrio_character_impl("lonely cloud", design_intent=dict(design_intent))
+        result1['character_name'] = "Changed"
+        result2 = _generate_sanrio_character_impl("lonely cloud", design_intent=design_intent)
+        
+        assert result2['character_name'] != "Changed"
+        assert design_intent['inferred_emotional_tone'] == result2['emotional_tone']
+    
+    def test_tone_only_design_intent_uses_intent_mapping(self):
+        """Test that an intent carrying only inferred_emotional_tone is still mapped."""
+        with_intent = _generate_sanrio_character_impl(
+            "tone only", design_intent={"inferred_emotional_tone": "x"}
+        )
+        without_intent = _generate_sanrio_character_impl("tone only")
+        
+        assert with_intent['size_category'] == 'medium_standard'
+        assert without_intent['size_category'] == 'small_plush_toy'
+    
     def test_character_has_design_guidelines(self):
         """Test that generated character includes design guidelines."""
         result = _generate_sanrio_character_impl("test character")
@@ -120,6 +229,16 @@ class TestCharacterGeneration:
         assert olog_source['intentionality_olog'] == 'sanrio_intentionality.olog.yaml'
         assert 'morphisms_applied' in olog_source
         assert 'commutative_diagrams_checked' in olog_source
+    
+    def test_nested_dicts_not_shared_between_calls(self):
+        """Test that mutating a cached result's nested dicts does not leak into later calls."""
+        result = _generate_sanrio_character_impl("rainy window")
+        result['olog_source']['aesthetic_olog'] = 'changed'
+        result['design_guidelines']['aesthetic'] = 'changed'
+        
+        again = _generate_sanrio_character_impl("rainy window")
+        assert again['olog_source']['aesthetic_olog'] == 'sanrio.olog.yaml'
+        assert again['design_guidelines']['aesthetic'] != 'changed'
 
 
 class TestArchetypeRules:
@@ -145,6 +264,14 @@ class TestArchetypeRules:
         assert rules['archetype'] == 'joyful_character_archetype'
         assert len(rules['design_keywords']) > 0
     
+    def test_archetype_rules_are_plain_shared_views(self):
+        """Test that archetype rules are plain JSON data projected once."""
+        rules = get_archetype_rules("joyful_character_archetype")
+        
+        assert type(rules) is dict
+        assert type(rules['design_keywords']) is list
+        assert get_archetype_rules("joyful_character_archetype") is rules
+    
     def test_invalid_archetype(self):
         """Test error handling for invalid archetype."""
         rules = get_archetype_rules("nonexistent_archetype")